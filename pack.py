@@ -97,37 +97,3 @@ def getModules(modules: Union[str, List[str]], depth: int = 1, **kwargs) \
     """
     packages, Modules = getPackages(modules, depth, **kwargs)
     return list((*[module for package in packages for module in package[1]], *Modules))
-def _pairwise(iterable):
-    """s -> (s0,s1), (s1,s2), (s2, s3), ..."""
-    a, b = tee(iterable)
-    next(b, None)
-    return zip(a, b)
-
-
-# class Package(Doc):
-#     """
-#     Representation of a package's documentation
-#     """
-#     __pdoc__["Package.name"] = """
-#         The name of this package with respect to the context/path in which
-#         it was imported from. It is always an absolute import path
-#         """
-#     __slots__ = {'modules', 'doc'}
-
-#     def __init__(self, package: str, *, docfilter: Callable[[Doc], bool] = None,
-#                  context: Context = None, skip_errors: bool = False):
-#         """
-#         Creates a 'Package' documentation object given the actual
-#         packaged Python object.
-
-#         'docfilter' is an optional predicate that controls which
-#         sub-objects are documentated (see also: `pdoc.html()`).
-
-#         'context' is an instance of 'pdoc.Context'. If 'None' a
-#         global context object will be used.
-
-#         If 'skip_errors' is 'True' and an unimportable, erroneous
-#         module or submodule is encountered, a warning will be
-#         issued instead of raising an exception.
-#         """
-#         super().__init__(package, self, )
@@ -2,139 +2,25 @@
 """pdoc's CLI interface and helper functions."""
 
 import argparse
-import ast
-import importlib
-import inspect
+import fnmatch
 import os
 import os.path as path
-import json
 import re
 import sys
+import threading
+import time
 import warnings
+from collections import deque
 from contextlib import contextmanager
-from functools import lru_cache
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from functools import lru_cache, partial
+from itertools import chain
+from os import scandir
+from os.path import abspath, basename, expanduser, isdir, isfile, join, realpath
 from typing import Dict, List, Sequence, Union, Tuple
 from warnings import warn
 
 import pdoc
 
-parser = argparse.ArgumentParser(
-    description="Automatically generate API docs for Python modules.",
-    epilog="Further documentation is available at <https://pdoc3.github.io/pdoc/doc>.",
-)
-aa = parser.add_argument
-mode_aa = parser.add_mutually_exclusive_group().add_argument
-
-aa(
-    '--version', action='version', version='%(prog)s ' + pdoc.__version__)
-aa(
-    "modules",
-    type=str,
-    metavar='MODULE',
-    nargs="+",
-    help="The Python module name. This may be an import path resolvable in "
-         "the current environment, or a file path to a Python module or "
-         "package.",
-)
-aa(
-    "-c", "--config",
-    type=str,
-    metavar='OPTION=VALUE',
-    action='append',
-    default=[],
-    help="Override template options. This is an alternative to using "
-         "a custom config.mako file in --template-dir. This option "
-         "can be specified multiple times.",
-)
-aa(
-    "--filter",
-    type=str,
-    metavar='STRING',
-    default=None,
-    help="Comma-separated list of filters. When specified, "
-         "only identifiers containing the specified string "
-         "will be shown in the output. Search is case sensitive. "
-         "Has no effect when --http is set.",
-)
-aa(
-    "-f", "--force",
-    action="store_true",
-    help="Overwrite any existing generated (--output-dir) files.",
-)
-aa(
-    '-d', '--depth',
-    type=int,
-    default=1,
-    help="Depth to search for modules."
-)
-aa(
-    '-i', '--ignore',
-    type=str,
-    nargs='*',
-    help='List of modules or directories to ignore, besides the default.'
-)
-mode_aa(
-    "--html",
-    action="store_true",
-    help="When set, the output will be HTML formatted.",
-)
-mode_aa(
-    "--pdf",
-    action="store_true",
-    help="When set, the specified modules will be printed to standard output, "
-         "formatted in Markdown-Extra, compatible with most "
-         "Markdown-(to-HTML-)to-PDF converters.",
-)
-aa(
-    "--html-dir",
-    type=str,
-    help=argparse.SUPPRESS,
-)
-aa(
-    "-o", "--output-dir",
-    type=str,
-    metavar='DIR',
-    help="The directory to output generated HTML/markdown files to "
-         "(default: ./html for --html).",
-)
-aa(
-    "--html-no-source",
-    action="store_true",
-    help=argparse.SUPPRESS,
-)
-aa(
-    "--overwrite",
-    action="store_true",
-    help=argparse.SUPPRESS,
-)
-aa(
-    "--external-links",
-    action="store_true",
-    help=argparse.SUPPRESS,
-)
-aa(
-    "--template-dir",
-    type=str,
-    metavar='DIR',
-    default=None,
-    help="Specify a directory containing Mako templates "
-         "(html.mako, text.mako, config.mako and/or any templates they include). "
-         "Alternatively, put your templates in $XDG_CONFIG_HOME/pdoc and "
-         "pdoc will automatically find them.",
-)
-aa(
-    "--link-prefix",
-    type=str,
-    help=argparse.SUPPRESS,
-)
-aa(
-    "--close-stdin",
-    action="store_true",
-    help="When set, stdin will be closed before importing, to account for "
-         "ill-behaved modules that block on stdin."
-)
-
 DEFAULT_HOST, DEFAULT_PORT = 'localhost', 8080
 
 
@@ -146,24 +32,200 @@ def _check_host_port(s):
     return s
 
 
-aa(
-    "--http",
-    default='',
-    type=_check_host_port,
-    metavar='HOST:PORT',
-    help="When set, pdoc will run as an HTTP server providing documentation "
-         "for specified modules. If you just want to use the default hostname "
-         "and port ({}:{}), set the parameter to :.".format(DEFAULT_HOST, DEFAULT_PORT),
-)
-aa(
-    "--skip-errors",
-    action="store_true",
-    help="Upon unimportable modules, warn instead of raising."
-)
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Automatically generate API docs for Python modules.",
+        epilog="Further documentation is available at <https://pdoc3.github.io/pdoc/doc>.",
+    )
+    aa = parser.add_argument
+    mode_aa = parser.add_mutually_exclusive_group().add_argument
+
+    aa(
+        '--version', action='version', version='%(prog)s ' + pdoc.__version__)
+    aa(
+        "modules",
+        type=str,
+        metavar='MODULE',
+        nargs="+",
+        help="The Python module name. This may be an import path resolvable in "
+             "the current environment, or a file path to a Python module or "
+             "package.",
+    )
+    aa(
+        "-c", "--config",
+        type=str,
+        metavar='OPTION=VALUE',
+        action='append',
+        default=[],
+        help="Override template options. This is an alternative to using "
+             "a custom config.mako file in --template-dir. This option "
+             "can be specified multiple times.",
+    )
+    aa(
+        "--filter",
+        type=str,
+        metavar='STRING',
+        default=None,
+        help="Comma-separated list of filters. When specified, "
+             "only identifiers containing the specified string "
+             "will be shown in the output. Search is case sensitive. "
+             "Has no effect when --http is set.",
+    )
+    aa(
+        "-f", "--force",
+        action="store_true",
+        help="Overwrite any existing generated (--output-dir) files.",
+    )
+    aa(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help="Number of worker processes used to write output files for "
+             "separate top-level modules in parallel "
+             "(0 means one per CPU; default: 1).",
+    )
+    aa(
+        '-d', '--depth',
+        type=int,
+        default=1,
+        help="Depth to search for modules."
+    )
+    aa(
+        '-i', '--ignore',
+        type=str,
+        nargs='*',
+        help='List of modules or directories to ignore, besides the default.'
+    )
+    mode_aa(
+        "--html",
+        action="store_true",
+        help="When set, the output will be HTML formatted.",
+    )
+    mode_aa(
+        "--pdf",
+        action="store_true",
+        help="When set, the specified modules will be printed to standard output, "
+             "formatted in Markdown-Extra, compatible with most "
+             "Markdown-(to-HTML-)to-PDF converters.",
+    )
+    aa(
+        "--html-dir",
+        type=str,
+        help=argparse.SUPPRESS,
+    )
+    aa(
+        "-o", "--output-dir",
+        type=str,
+        metavar='DIR',
+        help="The directory to output generated HTML/markdown files to "
+             "(default: ./html for --html).",
+    )
+    aa(
+        "--html-no-source",
+        action="store_true",
+        help=argparse.SUPPRESS,
+    )
+    aa(
+        "--overwrite",
+        action="store_true",
+        help=argparse.SUPPRESS,
+    )
+    aa(
+        "--external-links",
+        action="store_true",
+        help=argparse.SUPPRESS,
+    )
+    aa(
+        "--template-dir",
+        type=str,
+        metavar='DIR',
+        default=None,
+        help="Specify a directory containing Mako templates "
+             "(html.mako, text.mako, config.mako and/or any templates they include). "
+             "Alternatively, put your templates in $XDG_CONFIG_HOME/pdoc and "
+             "pdoc will automatically find them.",
+    )
+    aa(
+        "--link-prefix",
+        type=str,
+        help=argparse.SUPPRESS,
+    )
+    aa(
+        "--close-stdin",
+        action="store_true",
+        help="When set, stdin will be closed before importing, to account for "
+             "ill-behaved modules that block on stdin."
+    )
+
+    aa(
+        "--http",
+        default='',
+        type=_check_host_port,
+        metavar='HOST:PORT',
+        help="When set, pdoc will run as an HTTP server providing documentation "
+             "for specified modules. If you just want to use the default hostname "
+             "and port ({}:{}), set the parameter to :.".format(DEFAULT_HOST, DEFAULT_PORT),
+    )
+    aa(
+        "--skip-errors",
+        action="store_true",
+        help="Upon unimportable modules, warn instead of raising."
+    )
+    return parser
+
+
+def __getattr__(name):
+    # PEP 562: build the (fairly large) argument parser only when it is
+    # first asked for, instead of on every import of this module.
+    if name == 'parser':
+        return _build_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 args = argparse.Namespace()
 
 
+# Directory names never scanned for packages, plus suffix/prefix patterns
+# (startswith/endswith take tuples and run as one C-level loop).
+_SKIP_DIRS = frozenset({'venv', 'docs', 'build', 'dist', 'virtualenv'})
+_SKIP_SUFFIXES = ('.egg-info',)
+_SKIP_PREFIXES = ('.', '_')
+
+# How many directories getPackages checks concurrently at a time.
+_SCAN_BATCH = 32
+
+_import_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _import_module_cached(path: str):
+    """
+    Import (and cache) the module found at the absolute `path`.
+
+    Scanning probes the same directories repeatedly across depth levels;
+    importing is by far the most expensive part of the probe, so memoize
+    the result per path. The lock serializes the sys.path juggling done
+    by `pdoc.import_module` when probes run from worker threads.
+    """
+    with _import_lock:
+        return pdoc.import_module(path)
+
+
+@lru_cache(maxsize=None)
+def _path_is_module(path: str) -> bool:
+    # A regular package is recognized straight off the filesystem; only
+    # the namespace-package case (a directory of loose modules, whose
+    # __file__ exists but is None) needs the much costlier import probe,
+    # which executes __init__.py and its transitive imports.
+    # hasattr instead of `'__file__' in dir(...)`: a single attribute
+    # lookup, with no sorted attribute list built.
+    if isfile(join(path, '__init__.py')):
+        return True
+    return hasattr(_import_module_cached(path), '__file__')
+
+
 def getPackages(packages: Union[str, List[str]], depth: int = 1, **kwargs) \
         -> Tuple[List[Tuple[str, List[pdoc.Module]]], List[pdoc.Module]]:
     """
@@ -186,41 +248,57 @@ def getPackages(packages: Union[str, List[str]], depth: int = 1, **kwargs) \
         FileNotFoundError:   If one of the package directories provided does not exist.
     """
 
-    from os import walk, listdir
-    from os.path import abspath, expanduser, join, isdir, split
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Directory names to skip, resolved once per call rather than once per
+    # directory checked. Glob-style --ignore patterns are folded into a
+    # single precompiled alternation so each name costs one C-level scan.
+    skipDirs = _SKIP_DIRS.union(args.ignore or (),
+                                [args.output_dir] if args.output_dir else ())
+    globs = [i for i in (args.ignore or ()) if any(c in i for c in '*?[')]
+    skipRe = re.compile('|'.join(map(fnmatch.translate, globs))) if globs else None
+    # Bind the Module keyword arguments once instead of rebuilding the
+    # kwargs dict for every discovered module.
+    makeMod = partial(pdoc.Module, **kwargs)
+    # Memoized per call (not per module: abspath depends on the cwd), so
+    # a directory listed twice is only resolved once.
+    _norm = lru_cache(maxsize=None)(lambda p: abspath(expanduser(p)))
 
     def _check_if_module(module: Union[str, pdoc.Module]) -> bool:
         if isinstance(module, str):
-            module = pdoc.import_module(module)
-            if '__file__' in dir(module):
-                return True
-            return False
+            return _path_is_module(module)
         else:
             raise ImportError(f"{module} is not a module or package")
 
-    def _check_if_package(directory: str) -> Tuple[List[pdoc.Module], bool, List[str]]:
+    def _check_if_package(directory: str) -> Tuple[List[str], bool, List[str]]:
+        # `directory` is already normalized by the caller, and the
+        # subdirectories scandir() hands back inherit its absolute prefix,
+        # so no path is ever resolved twice.
         if not isinstance(directory, str):
             raise AssertionError("Directory has to be a string")
-        directory = abspath(expanduser(directory))
-        SKIP_DIRS = ['venv', 'docs', 'egg-info', 'build', 'dist', 'virtualenv']
-        SKIP_PREPEND = ['.', '_']
-        if args.ignore:
-            SKIP_DIRS += args.ignore
-        if args.output_dir:
-            SKIP_DIRS.append(args.output_dir)
-
-        packageMods, subDirs = [], []
+        moduleDirs, subDirs, hasSetup = [], [], False
+        # A single scandir() pass yields both the setup.py check and the
+        # subdirectories, with the entry type cached by the dirent itself.
+        with scandir(directory) as entries:
+            for entry in entries:
+                if entry.name == 'setup.py' and entry.is_file():
+                    hasSetup = True
+                elif (entry.is_dir(follow_symlinks=False)
+                      and entry.name not in skipDirs
+                      and not entry.name.endswith(_SKIP_SUFFIXES)
+                      and not entry.name.startswith(_SKIP_PREFIXES)
+                      and not (skipRe and skipRe.match(entry.name))):
+                    subDirs.append(entry.path)
+        pending = []
         if _check_if_module(directory):
-            packageMods.append(pdoc.Module(directory, **kwargs))
+            moduleDirs.append(directory)
         else:
-            subDirs = [join(directory, i) for i in next(walk(directory))[1]
-                       if not any(j in i for j in SKIP_DIRS) and i[0] not in SKIP_PREPEND]
             for dir_ in subDirs:
                 if _check_if_module(dir_):
-                    packageMods.append(pdoc.Module(dir_, **kwargs))
+                    moduleDirs.append(dir_)
                 else:
-                    subDirs.append(dir_)
-        return packageMods, True if 'setup.py' in listdir(directory) else False, subDirs
+                    pending.append(dir_)
+        return moduleDirs, hasSetup, pending
 
     if not isinstance(depth, int):
         print("Search depth is set to 1 level")
@@ -229,23 +307,54 @@ def getPackages(packages: Union[str, List[str]], depth: int = 1, **kwargs) \
     if not isinstance(packages, list):
         packages = [packages]
     ori_packages = packages
-    modules, packs, subdirs, errs = [], [], [], []
-
-    while depth:
-        for package in packages:
-            if isinstance(package, str) and isdir(abspath(expanduser(package))):
-                mods, pack, subd = _check_if_package(package)
-                if pack:
-                    packs.append((split(package)[1], mods))
-                else:
-                    modules.extend(mods)
-                    subdirs.extend(subd)
-            else:
+    modules, packs, errs = [], [], []
+    # Each queue entry carries its own remaining search depth plus the
+    # parent's resolved path (None for the caller's top-level arguments).
+    # Subdirectories found by scandir are known absolute directories and,
+    # having been filtered with follow_symlinks=False, known non-symlinks,
+    # so neither isdir() nor realpath() needs to stat them again.
+    frontier = deque((package, depth, None) for package in packages)
+    visited = set()  # realpaths already checked; guards against symlink loops
+
+    while frontier:
+        batch = []
+        while frontier and len(batch) < _SCAN_BATCH:
+            package, remaining, parentReal = frontier.popleft()
+            if not isinstance(package, str):
                 errs.append(str(package))
-        if not (packs or modules or subdirs):
-            raise FileNotFoundError(f"The directories {', '.join(errs)} do not exist.")
-        depth -= 1
-        packages, subdirs, errs = subdirs, [], []
+                continue
+            if parentReal is not None:
+                pkgPath = package
+                realPath = join(parentReal, basename(package))
+            else:
+                pkgPath = _norm(package)
+                if not isdir(pkgPath):
+                    errs.append(package)
+                    continue
+                realPath = realpath(pkgPath)
+            if realPath in visited:
+                continue
+            visited.add(realPath)
+            batch.append((package, pkgPath, remaining, realPath))
+        # Scanning is I/O-bound (scandir plus import probes), so check the
+        # batch's directories concurrently. Module objects are still built
+        # here in the calling thread.
+        if len(batch) > 1:
+            with ThreadPoolExecutor(max_workers=len(batch)) as executor:
+                results = executor.map(_check_if_package, [pth for _, pth, _, _ in batch])
+        else:
+            results = map(_check_if_package, [pth for _, pth, _, _ in batch])
+        for (package, _, remaining, realPath), (modDirs, pack, subd) in zip(batch,
+                                                                            results):
+            mods = [makeMod(dir_) for dir_ in modDirs]
+            if pack:
+                packs.append((basename(package), mods))
+            else:
+                modules.extend(mods)
+                if remaining > 1:
+                    frontier.extend((dir_, remaining - 1, realPath) for dir_ in subd)
+    if errs and not (packs or modules):
+        raise FileNotFoundError(f"The directories {', '.join(errs)} do not exist.")
     if not (modules or packs):
         raise ModuleNotFoundError(f"No modules or packages were found in "
                                   f"{' ,'.join(ori_packages)}")
@@ -258,185 +367,230 @@ def getModules(modules: Union[str, List[str]], depth: int = 1, **kwargs) \
     Retrieves all the modules from the getPackages() method.
     """
     packages, Modules = getPackages(modules, depth, **kwargs)
-    return list((*[module for package in packages for module in package[1]], *Modules))
-
-
-class _WebDoc(BaseHTTPRequestHandler):
-    args = None  # Set before server instantiated
-    template_config = None
-
-    def do_HEAD(self):
-        status = 200
-        if self.path != "/":
-            status = self.check_modified()
-
-        self.send_response(status)
-        self.send_header("Content-type", "text/html; charset=utf-8")
-        self.end_headers()
-
-    def check_modified(self):
-        try:
-            module = pdoc.import_module(self.import_path_from_req_url)
-            new_etag = str(os.stat(module.__file__).st_mtime)
-        except ImportError:
-            return 404
-
-        old_etag = self.headers.get('If-None-Match', new_etag)
-        if old_etag == new_etag:
-            # Don't log repeating checks
-            self.log_request = lambda *args, **kwargs: None
-            return 304
-
-        return 205
-
-    def do_GET(self):
-        # Deny favicon shortcut early.
-        if self.path == "/favicon.ico":
-            return None
-
-        importlib.invalidate_caches()
-        code = 200
-        if self.path == "/":
-            modules = []
-            modules.extend(getModules(module)
-                           for module in self.args.modules)
-            modules = [pdoc.import_module(module, reload=True)
-                       for module in self.args.modules]
-            modules = [(module.__name__, inspect.getdoc(module))
-                       for module in modules]
-            if not self.args.unsorted:
-                modules.sort()
-            out = pdoc._render_template('/html.mako',
-                                        modules=modules,
-                                        **self.template_config)
-        elif self.path.endswith(".ext"):
-            # External links are a bit weird. You should view them as a giant
-            # hack. Basically, the idea is to "guess" where something lives
-            # when documenting another module and hope that guess can actually
-            # track something down in a more global context.
-            #
-            # The idea here is to start specific by looking for HTML that
-            # exists that matches the full external path given. Then trim off
-            # one component at the end and try again.
-            #
-            # If no HTML is found, then we ask `pdoc` to do its thang on the
-            # parent module in the external path. If all goes well, that
-            # module will then be able to find the external identifier.
-
-            import_path = self.path[:-4].lstrip("/")
-            resolved = self.resolve_ext(import_path)
-            if resolved is None:  # Try to generate the HTML...
-                print("Generating HTML for %s on the fly..." % import_path, file=sys.stderr)
+    return list(chain(chain.from_iterable(mods for _, mods in packages), Modules))
+
+
+# import_path -> (monotonic time of check, mtime). A short TTL collapses
+# bursts of browser requests for the same page into one import + stat.
+_mtime_cache = {}  # type: Dict[str, Tuple[float, float]]
+_MTIME_CACHE_TTL = 1.0  # seconds
+
+# URL suffixes stripped when mapping a request path to an import path.
+_URL_SUFFIXES = ('/',
+                 pdoc._URL_PACKAGE_SUFFIX,
+                 pdoc._URL_INDEX_MODULE_SUFFIX,
+                 pdoc._URL_MODULE_SUFFIX)
+
+
+@lru_cache(maxsize=1)
+def _make_webdoc_class():
+    # http.server drags in socket, socketserver and email machinery;
+    # only --http runs need any of it, so the handler class is built
+    # on first use.
+    from http.server import BaseHTTPRequestHandler
+
+    class _WebDoc(BaseHTTPRequestHandler):
+        args = None  # Set before server instantiated
+        template_config = None
+
+        def do_HEAD(self):
+            # One request can need the import path several times; derive it
+            # from the URL once up front.
+            self.import_path_from_req_url = self._compute_import_path(self.path)
+            status = 200
+            if self.path != "/":
+                status = self.check_modified()
+
+            self.send_response(status)
+            self.send_header("Content-type", "text/html; charset=utf-8")
+            self.end_headers()
+
+        def check_modified(self):
+            import_path = self.import_path_from_req_url
+            now = time.monotonic()
+            cached = _mtime_cache.get(import_path)
+            if cached and now - cached[0] < _MTIME_CACHE_TTL:
+                mtime = cached[1]
+            else:
                 try:
-                    out = pdoc.html(import_path.split(".")[0], **self.template_config)
-                except Exception as e:
-                    print('Error generating docs: {}'.format(e), file=sys.stderr)
-                    # All hope is lost.
-                    code = 404
-                    out = "External identifier <code>%s</code> not found." % import_path
+                    module = pdoc.import_module(import_path)
+                    mtime = os.stat(module.__file__).st_mtime
+                except ImportError:
+                    return 404
+                _mtime_cache[import_path] = (now, mtime)
+
+            new_etag = str(mtime)
+            old_etag = self.headers.get('If-None-Match', new_etag)
+            if old_etag == new_etag:
+                # Don't log repeating checks
+                self.log_request = lambda *args, **kwargs: None
+                return 304
+
+            return 205
+
+        def do_GET(self):
+            # Deny favicon shortcut early.
+            if self.path == "/favicon.ico":
+                return None
+
+            self.import_path_from_req_url = self._compute_import_path(self.path)
+
+            import importlib
+            import inspect
+
+            importlib.invalidate_caches()
+            code = 200
+            if self.path == "/":
+                modules = [pdoc.import_module(module, reload=True)
+                           for module in self.args.modules]
+                modules = [(module.__name__, inspect.getdoc(module))
+                           for module in modules]
+                if not self.args.unsorted:
+                    modules.sort()
+                out = pdoc._render_template('/html.mako',
+                                            modules=modules,
+                                            **self.template_config)
+            elif self.path.endswith(".ext"):
+                # External links are a bit weird. You should view them as a giant
+                # hack. Basically, the idea is to "guess" where something lives
+                # when documenting another module and hope that guess can actually
+                # track something down in a more global context.
+                #
+                # The idea here is to start specific by looking for HTML that
+                # exists that matches the full external path given. Then trim off
+                # one component at the end and try again.
+                #
+                # If no HTML is found, then we ask `pdoc` to do its thang on the
+                # parent module in the external path. If all goes well, that
+                # module will then be able to find the external identifier.
+
+                import_path = self.path[:-4].lstrip("/")
+                resolved = self.resolve_ext(import_path)
+                if resolved is None:  # Try to generate the HTML...
+                    print("Generating HTML for %s on the fly..." % import_path, file=sys.stderr)
+                    try:
+                        out = pdoc.html(import_path.split(".")[0], **self.template_config)
+                    except Exception as e:
+                        print('Error generating docs: {}'.format(e), file=sys.stderr)
+                        # All hope is lost.
+                        code = 404
+                        out = "External identifier <code>%s</code> not found." % import_path
+                else:
+                    return self.redirect(resolved)
+            # Redirect '/pdoc' to '/pdoc/' so that relative links work
+            # (results in '/pdoc/cli.html' instead of 'cli.html')
+            elif not self.path.endswith(('/', '.html')):
+                return self.redirect(self.path + '/')
+            # Redirect '/pdoc/index.html' to '/pdoc/' so it's more pretty
+            elif self.path.endswith(pdoc._URL_PACKAGE_SUFFIX):
+                return self.redirect(self.path[:-len(pdoc._URL_PACKAGE_SUFFIX)] + '/')
             else:
-                return self.redirect(resolved)
-        # Redirect '/pdoc' to '/pdoc/' so that relative links work
-        # (results in '/pdoc/cli.html' instead of 'cli.html')
-        elif not self.path.endswith(('/', '.html')):
-            return self.redirect(self.path + '/')
-        # Redirect '/pdoc/index.html' to '/pdoc/' so it's more pretty
-        elif self.path.endswith(pdoc._URL_PACKAGE_SUFFIX):
-            return self.redirect(self.path[:-len(pdoc._URL_PACKAGE_SUFFIX)] + '/')
-        else:
-            try:
-                out = self.html()
-            except Exception:
-                import traceback
-                from html import escape
-                code = 404
-                out = "Error importing module <code>{}</code>:\n\n<pre>{}</pre>".format(
-                    self.import_path_from_req_url, escape(traceback.format_exc()))
-                out = out.replace('\n', '<br>')
-
-        self.send_response(code)
-        self.send_header("Content-type", "text/html; charset=utf-8")
-        self.end_headers()
-        self.echo(out)
-
-    def redirect(self, location):
-        self.send_response(302)
-        self.send_header("Location", location)
-        self.end_headers()
-
-    def echo(self, s):
-        self.wfile.write(s.encode("utf-8"))
-
-    def html(self):
-        """
-        Retrieves and sends the HTML belonging to the path given in
-        URL. This method is smart and will look for HTML files already
-        generated and account for whether they are stale compared to
-        the source code.
-        """
-        return pdoc.html(self.import_path_from_req_url,
-                         reload=True, http_server=True, external_links=True,
-                         skip_errors=args.skip_errors,
-                         **self.template_config)
-
-    def resolve_ext(self, import_path):
-        def exists(p):
-            p = path.join(args.output_dir, p)
-            pkg = path.join(p, pdoc._URL_PACKAGE_SUFFIX.lstrip('/'))
-            mod = p + pdoc._URL_MODULE_SUFFIX
-
-            if path.isfile(pkg):
-                return pkg[len(args.output_dir):]
-            elif path.isfile(mod):
-                return mod[len(args.output_dir):]
+                try:
+                    out = self.html()
+                except Exception:
+                    import traceback
+                    from html import escape
+                    code = 404
+                    out = "Error importing module <code>{}</code>:\n\n<pre>{}</pre>".format(
+                        self.import_path_from_req_url, escape(traceback.format_exc()))
+                    out = out.replace('\n', '<br>')
+
+            self.send_response(code)
+            self.send_header("Content-type", "text/html; charset=utf-8")
+            self.end_headers()
+            self.echo(out)
+
+        def redirect(self, location):
+            self.send_response(302)
+            self.send_header("Location", location)
+            self.end_headers()
+
+        def echo(self, s):
+            self.wfile.write(s.encode("utf-8"))
+
+        def html(self):
+            """
+            Retrieves and sends the HTML belonging to the path given in
+            URL. This method is smart and will look for HTML files already
+            generated and account for whether they are stale compared to
+            the source code.
+            """
+            return pdoc.html(self.import_path_from_req_url,
+                             reload=True, http_server=True, external_links=True,
+                             skip_errors=args.skip_errors,
+                             **self.template_config)
+
+        def resolve_ext(self, import_path):
+            def exists(p):
+                p = path.join(args.output_dir, p)
+                pkg = path.join(p, pdoc._URL_PACKAGE_SUFFIX.lstrip('/'))
+                mod = p + pdoc._URL_MODULE_SUFFIX
+
+                if path.isfile(pkg):
+                    return pkg[len(args.output_dir):]
+                elif path.isfile(mod):
+                    return mod[len(args.output_dir):]
+                return None
+
+            parts = import_path.split(".")
+            for i in range(len(parts), 0, -1):
+                p = path.join(*parts[0:i])
+                realp = exists(p)
+                if realp is not None:
+                    return "/%s#%s" % (realp.lstrip("/"), import_path)
             return None
 
-        parts = import_path.split(".")
-        for i in range(len(parts), 0, -1):
-            p = path.join(*parts[0:i])
-            realp = exists(p)
-            if realp is not None:
-                return "/%s#%s" % (realp.lstrip("/"), import_path)
-        return None
+        @staticmethod
+        def _compute_import_path(pth):
+            pth = pth.partition('#')[0].lstrip('/')
+            for suffix in _URL_SUFFIXES:
+                if pth.endswith(suffix):
+                    pth = pth[:-len(suffix)]
+                    break
+            return pth.replace('/', '.')
 
-    @property
-    def import_path_from_req_url(self):
-        pth = self.path.split('#')[0].lstrip('/')
-        for suffix in ('/',
-                       pdoc._URL_PACKAGE_SUFFIX,
-                       pdoc._URL_INDEX_MODULE_SUFFIX,
-                       pdoc._URL_MODULE_SUFFIX):
-            if pth.endswith(suffix):
-                pth = pth[:-len(suffix)]
-                break
-        return pth.replace('/', '.')
+    return _WebDoc
 
 
-def module_path(m: pdoc.Module, ext: str):
-    return path.join(args.output_dir, *re.sub(r'\.html$', ext, m.url()).split('/'))
+_IS_POSIX = os.sep == '/'
 
 
-def _quit_if_exists(m: pdoc.Module, ext: str):
-    if args.force:
-        return
+def module_path(m: pdoc.Module, ext: str) -> str:
+    url = m.url()
+    if url.endswith('.html'):
+        url = url[:-len('.html')] + ext
+    if _IS_POSIX:
+        # Module urls already use '/' separators; skip the split/join
+        # round-trip where '/' is also the path separator.
+        return args.output_dir + '/' + url
+    return path.join(args.output_dir, *url.split('/'))
 
-    paths = [module_path(m, ext)]
-    if m.is_package:  # If package, make sure the dir doesn't exist either
-        paths.append(path.dirname(paths[0]))
 
+def _quit_if_exists(m: pdoc.Module, ext: str) -> str:
+    filepath = module_path(m, ext)
+    if args.force:
+        return filepath
+
+    # If package, make sure the dir doesn't exist either
+    paths = (filepath, path.dirname(filepath)) if m.is_package else (filepath,)
     for pth in paths:
-        if path.lexists(pth):
-            print("File '%s' already exists. Delete it, or run with --force" % pth,
-                  file=sys.stderr)
-            sys.exit(1)
+        try:
+            os.lstat(pth)
+        except OSError:
+            continue
+        print("File '%s' already exists. Delete it, or run with --force" % pth,
+              file=sys.stderr)
+        sys.exit(1)
+    return filepath
 
 
 @contextmanager
 def _open_write_file(filename):
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
+        # A 1 MiB buffer keeps large rendered pages to a few write syscalls.
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
             yield f
-            print(filename)  # print created file path to stdout
+            sys.stdout.write(filename + '\n')  # print created file path to stdout
     except Exception:
         try:
             os.unlink(filename)
@@ -445,29 +599,77 @@ def _open_write_file(filename):
         raise
 
 
-def recursive_write_files(m: pdoc.Module, ext: str, **kwargs):
+def recursive_write_files(m: pdoc.Module, ext: str, filepath: str = None, **kwargs):
     assert ext in ('.html', '.md')
-    filepath = module_path(m, ext=ext)
+    # Pre-order traversal with an explicit work list instead of one Python
+    # frame per submodule. `filepath`, when given, is the already-computed
+    # module_path(m, ext) from the _quit_if_exists precheck.
+    stack = deque(((m, filepath or module_path(m, ext=ext)),))
+    while stack:
+        module, filepath = stack.popleft()
+
+        dirpath = path.dirname(filepath)
+        os.makedirs(dirpath, exist_ok=True)
+
+        with _open_write_file(filepath) as f:
+            if ext == '.html':
+                f.write(module.html(**kwargs))
+            elif ext == '.md':
+                f.write(module.text(**kwargs))
+
+        stack.extendleft((sub, module_path(sub, ext=ext))
+                         for sub in reversed(module.submodules()))
 
-    dirpath = path.dirname(filepath)
-    if not os.access(dirpath, os.R_OK):
-        os.makedirs(dirpath)
 
-    with _open_write_file(filepath) as f:
-        if ext == '.html':
-            f.write(m.html(**kwargs))
-        elif ext == '.md':
-            f.write(m.text(**kwargs))
+# Work list for _write_files_parallel, inherited by its forked workers.
+# Dispatching list indices instead of the modules themselves avoids pickling
+# pdoc.Module objects, which hold references to live module objects.
+_parallel_state = None  # type: Tuple[List[pdoc.Module], List[str], str, dict]
 
-    for submodule in m.submodules():
-        recursive_write_files(submodule, ext=ext, **kwargs)
+
+def _fork_supported() -> bool:
+    import multiprocessing
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _write_files_job(index: int):
+    modules, filepaths, ext, template_config = _parallel_state
+    recursive_write_files(modules[index], ext=ext, filepath=filepaths[index],
+                          **template_config)
+
+
+def _write_files_parallel(modules: List[pdoc.Module], filepaths: List[str],
+                          ext: str, jobs: int, **kwargs):
+    """
+    Write each top-level module's subtree from its own worker process.
+    Workers are forked after the documentation tree is fully built and
+    linked, so they inherit `args` and the tree without pickling, and each
+    subtree writes to its own set of files.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    global _parallel_state
+    _parallel_state = (modules, filepaths, ext, kwargs)
+    try:
+        with ProcessPoolExecutor(
+                max_workers=min(jobs, len(modules)),
+                mp_context=multiprocessing.get_context('fork')) as executor:
+            # Drain the results so worker exceptions propagate
+            for _ in executor.map(_write_files_job, range(len(modules))):
+                pass
+    finally:
+        _parallel_state = None
 
 
 def _flatten_submodules(modules: Sequence[pdoc.Module]):
-    for module in modules:
+    # Same pre-order traversal as the old recursive version, but with one
+    # shared work list instead of a generator frame per submodule.
+    stack = deque(modules)
+    while stack:
+        module = stack.popleft()
         yield module
-        for submodule in module.submodules():
-            yield from _flatten_submodules((submodule,))
+        stack.extendleft(reversed(module.submodules()))
 
 
 def _print_pdf(modules, **kwargs):
@@ -485,20 +687,47 @@ def _warn_deprecated(option, alternative='', use_config_mako=False):
     warn(msg, DeprecationWarning, stacklevel=2)
 
 
+_CONFIG_LITERALS = {'True': True, 'False': False, 'None': None}
+
+
+def _parse_config_value(value: str):
+    """
+    Evaluate a --config value, handling the common cases (bools, None,
+    integers, plainly quoted strings) without importing `ast`.
+    """
+    if value in _CONFIG_LITERALS:
+        return _CONFIG_LITERALS[value]
+    if value.lstrip('+-').isdigit():
+        return int(value)
+    if (len(value) >= 2 and value[0] == value[-1] and value[0] in '\'"'
+            and value[0] not in value[1:-1] and '\\' not in value):
+        return value[1:-1]
+    import ast  # Only exotic values (floats, lists, escapes, ...) need this
+    return ast.literal_eval(value)
+
+
+# Compiled once; the search index runs this over every docstring of
+# every documented object.
+_TRIM_DOCSTRING_RE = re.compile(r'''
+    \s+|                   # whitespace sequences
+    \s+[-=~]{3,}\s+|       # title underlines
+    ^[ \t]*[`~]{3,}\w*$|   # code blocks
+    \s*[`#*]+\s*|          # common markdown chars
+    \s*([^\w\d_>])\1\s*|   # sequences of punct of the same kind
+    \s*</?\w*[^>]*>\s*     # simple HTML tags
+''', re.VERBOSE | re.MULTILINE)
+
+
 def _generate_lunr_search(top_module: pdoc.Module,
                           index_docstrings: bool,
                           template_config: dict):
     """Generate index.js for search"""
+    import json
 
     def trim_docstring(docstring):
-        return re.sub(r'''
-            \s+|                   # whitespace sequences
-            \s+[-=~]{3,}\s+|       # title underlines
-            ^[ \t]*[`~]{3,}\w*$|   # code blocks
-            \s*[`#*]+\s*|          # common markdown chars
-            \s*([^\w\d_>])\1\s*|   # sequences of punct of the same kind
-            \s*</?\w*[^>]*>\s*     # simple HTML tags
-        ''', ' ', docstring, flags=re.VERBOSE | re.MULTILINE)
+        if not docstring:
+            return ''
+        return _TRIM_DOCSTRING_RE.sub(' ', docstring)
 
     def recursive_add_to_index(dobj):
         info = {
@@ -509,32 +738,45 @@ def _generate_lunr_search(top_module: pdoc.Module,
             info['doc'] = trim_docstring(dobj.docstring)
         if isinstance(dobj, pdoc.Function):
             info['func'] = 1
-        index.append(info)
+        emit(info)
         for member_dobj in getattr(dobj, 'doc', {}).values():
             recursive_add_to_index(member_dobj)
 
-    @lru_cache()
     def to_url_id(module):
         url = module.url()
         if top_module.is_package:  # Reference from subfolder if its a package
-            _, url = url.split('/', maxsplit=1)
-        if url not in url_cache:
-            url_cache[url] = len(url_cache)
-        return url_cache[url]
+            url = url.split('/', maxsplit=1)[1]
+        # Ids are handed out monotonically, so urls stays sorted by id and
+        # needs no final sort; setdefault is one hash lookup per call.
+        url_id = url_cache.setdefault(url, len(url_cache))
+        if url_id == len(urls):
+            urls.append(url)
+        return url_id
 
-    index = []  # type: List[Dict]
     url_cache = {}  # type: Dict[str, int]
-    recursive_add_to_index(top_module)
-    urls = [i[0] for i in sorted(url_cache.items(), key=lambda i: i[1])]
+    urls = []  # type: List[str]
+    encode = json.JSONEncoder(separators=(',', ':')).iterencode
+    emitted = False
+
+    def emit(info):
+        # Stream entries out while the tree is walked, instead of holding
+        # the whole index (and a second serialized copy) in memory.
+        nonlocal emitted
+        if emitted:
+            f.write(',')
+        emitted = True
+        f.writelines(encode(info))
 
     # If top module is a package, output the index in its subfolder, else, in the output dir
     main_path = path.join(args.output_dir,
                           *top_module.name.split('.') if top_module.is_package else '')
     with _open_write_file(path.join(main_path, 'index.js')) as f:
-        f.write("URLS=")
+        # URLS= follows INDEX= because url_cache is only complete after the
+        # walk; both assignments run before the script is ever used.
+        f.write("INDEX=[")
+        recursive_add_to_index(top_module)
+        f.write("];\nURLS=")
         json.dump(urls, f, indent=0, separators=(',', ':'))
-        f.write(";\nINDEX=")
-        json.dump(index, f, indent=0, separators=(',', ':'))
 
     # Generate search.html
     with _open_write_file(path.join(main_path, 'search.html')) as f:
@@ -547,7 +789,11 @@ def _generate_lunr_search(top_module: pdoc.Module,
 def main(_args=None):
     """ Command-line entry point """
     global args
-    args = _args or parser.parse_args()
+    if _args is None and len(sys.argv) == 2 and sys.argv[1] == '--version':
+        # Short-circuit before the parser is even built.
+        print('pdoc', pdoc.__version__)
+        return
+    args = _args or _build_parser().parse_args()
 
     warnings.simplefilter("once", DeprecationWarning)
 
@@ -560,16 +806,20 @@ def main(_args=None):
     if args.html_dir:
         _warn_deprecated('--html-dir', '--output-dir')
         args.output_dir = args.html_dir
+    if args.output_dir and _IS_POSIX:
+        # module_path concatenates the output dir and url with a single '/'
+        args.output_dir = args.output_dir.rstrip('/') or '/'
     if args.overwrite:
         _warn_deprecated('--overwrite', '--force')
         args.force = args.overwrite
 
+    # Built exactly once per process; the HTTP server and the file-writing
+    # branch below both reuse this dict for every render.
     template_config = {}
     for config_str in args.config:
         try:
             key, value = config_str.split('=', 1)
-            value = ast.literal_eval(value)
-            template_config[key] = value
+            template_config[key] = _parse_config_value(value)
         except Exception:
             raise ValueError(
                 'Error evaluating --config statement "{}". '
@@ -598,18 +848,21 @@ def main(_args=None):
     sys.path.append(os.getcwd())
 
     # Virtual environment handling for pdoc script run from system site
-    try:
-        venv_dir = os.environ['VIRTUAL_ENV']
-    except KeyError:
-        pass  # pdoc was not invoked while in a virtual environment
-    else:
-        from glob import glob
-        from distutils.sysconfig import get_python_lib
-        libdir = get_python_lib(prefix=venv_dir)
+    venv_dir = os.environ.get('VIRTUAL_ENV')
+    if venv_dir:  # pdoc was invoked while in a virtual environment
+        import sysconfig
+        libdir = sysconfig.get_paths(vars={'base': venv_dir,
+                                           'platbase': venv_dir})['purelib']
         sys.path.append(libdir)
         # Resolve egg-links from `setup.py develop` or `pip install -e`
         # XXX: Welcome a more canonical approach
-        for pth in glob(path.join(libdir, '*.egg-link')):
+        try:
+            with scandir(libdir) as entries:
+                egg_links = [entry.path for entry in entries
+                             if entry.name.endswith('.egg-link')]
+        except FileNotFoundError:
+            egg_links = []
+        for pth in egg_links:
             try:
                 with open(pth) as f:
                     sys.path.append(path.join(libdir, f.readline().rstrip()))
@@ -620,6 +873,9 @@ def main(_args=None):
         template_config['link_prefix'] = "/"
 
         # Run the HTTP server.
+        from http.server import HTTPServer
+
+        _WebDoc = _make_webdoc_class()
         _WebDoc.args = args  # Pass params to HTTPServer xP
         _WebDoc.template_config = template_config
 
@@ -643,10 +899,29 @@ def main(_args=None):
 
     docfilter = None
     if args.filter and args.filter.strip():
-        def docfilter(obj, _filters=args.filter.strip().split(',')):
-            return any(f in obj.refname or
-                       isinstance(obj, pdoc.Class) and f in obj.doc
-                       for f in _filters)
+        _filters = tuple(args.filter.strip().split(','))
+        if len(_filters) >= 4:
+            # With many filters, one C-level scan of a compiled alternation
+            # beats a Python-level loop of substring tests.
+            _filter_re = re.compile('|'.join(map(re.escape, _filters)))
+
+            def docfilter(obj):
+                if _filter_re.search(obj.refname):
+                    return True
+                return (isinstance(obj, pdoc.Class)
+                        and any(f in obj.doc for f in _filters))
+        else:
+            def docfilter(obj, _filters=_filters):
+                refname = obj.refname
+                for f in _filters:
+                    if f in refname:
+                        return True
+                if isinstance(obj, pdoc.Class):
+                    doc = obj.doc
+                    for f in _filters:
+                        if f in doc:
+                            return True
+                return False
 
     modules = []
     modules.extend(module for module in
@@ -688,19 +963,24 @@ or similar, at your own discretion.""".format(PANDOC_CMD=textwrap.indent(_PANDOC
 
     lunr_config = pdoc._get_config(**template_config).get('lunr_search')
 
-    for module in modules:
-        if args.html:
-            _quit_if_exists(module, ext='.html')
-            recursive_write_files(module, ext='.html', **template_config)
+    if args.html or args.output_dir:
+        ext = '.html' if args.html else '.md'
+        filepaths = [_quit_if_exists(module, ext=ext) for module in modules]
+
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        if jobs > 1 and len(modules) > 1 and _fork_supported():
+            _write_files_parallel(modules, filepaths, ext, jobs, **template_config)
+        else:
+            for module, filepath in zip(modules, filepaths):
+                recursive_write_files(module, ext=ext, filepath=filepath,
+                                      **template_config)
 
-            if lunr_config is not None:
+        if args.html and lunr_config is not None:
+            for module in modules:
                 _generate_lunr_search(
                     module, lunr_config.get("index_docstrings", True), template_config)
-
-        elif args.output_dir:  # Generate text files
-            _quit_if_exists(module, ext='.md')
-            recursive_write_files(module, ext='.md', **template_config)
-        else:
+    else:
+        for module in modules:
             sys.stdout.write(module.text(**template_config))
             # Two blank lines between two modules' texts
             sys.stdout.write(os.linesep * (1 + 2 * int(module != modules[-1])))
@@ -714,4 +994,4 @@ pandoc --metadata=title:"MyProject Documentation"               \\
 '''
 
 if __name__ == "__main__":
-    main(parser.parse_args())
+    main()